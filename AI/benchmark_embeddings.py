@@ -0,0 +1,141 @@
+import json
+import resource
+import subprocess
+import sys
+import time
+
+source_file = "ndw_documentation_pdf_depth_10.json"
+index_file = "ndw_faiss_pdf_depth_10.index"  # built with sentence-transformers
+reference_backend = "sentence-transformers"
+backends = ["sentence-transformers", "onnx", "onnx-int8"]
+num_queries = 200
+consistency_docs = 500
+top_k = 10
+distance_threshold = 1.5  # same filter as NDWDocBot.search_docs
+
+# Minimum cosine similarity with the PyTorch embeddings, int8 weights cost some precision
+min_cosine = {
+    "onnx": 0.999,
+    "onnx-int8": 0.98
+}
+
+# Libraries each backend needs, timed separately from loading the model
+backend_imports = {
+    "sentence-transformers": ["sentence_transformers"],
+    "onnx": ["onnxruntime", "tokenizers"],
+    "onnx-int8": ["onnxruntime", "tokenizers"]
+}
+
+queries = [
+    "How do I get access to the NDW open data?",
+    "What is the format of the traffic speed data?",
+    "Where can I find the DATEX II documentation?",
+    "Hoe kan ik actuele verkeersinformatie opvragen?",
+    "Which measurement sites are available?"
+]
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_backend(name):
+    """Measure one backend, runs in a fresh process so import time and RSS are not shared"""
+    import importlib
+    from embedding_backend import load_embedding_backend
+
+    start = time.perf_counter()
+    for module in backend_imports[name]:
+        importlib.import_module(module)
+    import_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    backend = load_embedding_backend(name)
+    load_time = time.perf_counter() - start
+
+    # Warm up, then encode single queries like NDWDocBot.search_docs does
+    backend.encode(queries[:1])
+    start = time.perf_counter()
+    for i in range(num_queries):
+        backend.encode([queries[i % len(queries)]])
+    query_time = time.perf_counter() - start
+    query_rss = max_rss_mb()
+
+    # Batch encode documents for the consistency check, this raises the peak RSS
+    with open(source_file, "r", encoding="utf-8") as f:
+        docs = json.load(f)[:consistency_docs]
+    texts = [f"{doc['title']}: {doc['content']}" for doc in docs]
+    embeddings = backend.encode(texts)
+    batch_rss = max_rss_mb()
+
+    # Search the existing (PyTorch built) index the way the bot does
+    import faiss
+    index = faiss.read_index(index_file)
+    distances, indices = index.search(backend.encode(queries), top_k)
+
+    return {
+        "import_seconds": import_time,
+        "load_seconds": load_time,
+        "queries_per_second": num_queries / query_time,
+        "query_rss_mb": query_rss,
+        "batch_rss_mb": batch_rss,
+        "embeddings": embeddings.tolist(),
+        "distances": distances.tolist(),
+        "indices": indices.tolist()
+    }
+
+
+def main(names):
+    import numpy as np
+
+    results = {}
+    failed = []
+    for name in names:
+        print(f"Benchmarking {name}...")
+        process = subprocess.run([sys.executable, __file__, "--child", name], capture_output=True, text=True)
+        if process.returncode != 0:
+            print(f"✗ {name} failed:\n{process.stderr}")
+            failed.append(name)
+            continue
+        results[name] = json.loads(process.stdout.splitlines()[-1])
+
+    reference = results.get(reference_backend)
+    if reference is None:
+        print(f"\nNo {reference_backend} reference, skipping the consistency check")
+
+    print(f"\n{'Backend':<22}{'Import (s)':>11}{'Load (s)':>10}{'Queries/s':>11}{'Query RSS':>11}{'Batch RSS':>11}"
+          f"{'Min cos':>9}{'Max diff':>10}{'Hits':>6}{'Top-k':>7}")
+    print("=" * 108)
+    for name, result in results.items():
+        # Hits: results under the search_docs distance filter, Top-k: overlap with the reference results
+        distances = np.array(result["distances"])
+        hits = int((distances < distance_threshold).sum())
+        cosine = max_diff = overlap = "-"
+        if reference is not None:
+            embeddings = np.array(result["embeddings"], dtype=np.float32)
+            reference_embeddings = np.array(reference["embeddings"], dtype=np.float32)
+            cosine = (embeddings * reference_embeddings).sum(axis=1).min()
+            max_diff = np.abs(embeddings - reference_embeddings).max()
+            overlap = sum(len(set(a) & set(b)) for a, b in zip(result["indices"], reference["indices"]))
+            if cosine < min_cosine.get(name, -1.0):
+                print(f"✗ {name}: min cosine {cosine:.4f} is below {min_cosine[name]}")
+                failed.append(name)
+            cosine, max_diff = f"{cosine:.4f}", f"{max_diff:.4f}"
+
+        print(f"{name:<22}{result['import_seconds']:>11.2f}{result['load_seconds']:>10.2f}"
+              f"{result['queries_per_second']:>11.1f}{result['query_rss_mb']:>11.0f}{result['batch_rss_mb']:>11.0f}"
+              f"{cosine:>9}{max_diff:>10}{hits:>6}{overlap:>7}")
+    print(f"(RSS in MB, Hits/Top-k summed over {len(queries)} queries with top {top_k})")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        print(json.dumps(run_backend(sys.argv[2])))
+    elif "--no-reference" in sys.argv:
+        # GPU-less hosts with only requirements-cpu.txt installed
+        main([name for name in backends if name != reference_backend])
+    else:
+        main(backends)
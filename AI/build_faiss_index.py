@@ -1,23 +1,24 @@
 import json
 import faiss
-from sentence_transformers import SentenceTransformer
+from embedding_backend import load_embedding_backend
 
 source_file = "ndw_documentation_pdf_depth_10.json"
 output_file = "ndw_faiss_pdf_depth_10.index"
 metadata_file = "ndw_metadata_pdf_depth_10.json"
+embedding_backend_name = None  # None uses the EMBEDDING_BACKEND env var (default "sentence-transformers")
 
 # 1. Load scraped data from JSON
 with open(source_file, "r", encoding="utf-8") as f:
     docs = json.load(f)
 
-# 2. Initialize the SentenceTransformer model
-model = SentenceTransformer("all-MiniLM-L6-v2")
+# 2. Initialize the embedding backend
+model = load_embedding_backend(embedding_backend_name)
 
 # 3. Prepare texts for embedding
 texts = [f"{doc["title"]}: {doc["content"]}" for doc in docs]
 
 # 4. Generate embeddings
-embeddings = model.encode(texts, show_progress_bar=True, convert_to_numpy=True)
+embeddings = model.encode(texts, show_progress_bar=True)
 
 # 5. Determine the embedding dimension
 embedding_dim = embeddings.shape[1]
@@ -1,7 +1,7 @@
 import json
 import faiss
 import requests
-from sentence_transformers import SentenceTransformer
+from embedding_backend import load_embedding_backend
 import time
 import sys
 import threading
@@ -10,7 +10,8 @@ import itertools
 index_file = "AI/ndw_faiss_pdf_depth_10.index"
 metadata_file = "AI/ndw_metadata_pdf_depth_10.json"
 model_name = "llama3.2:latest"
-embedding_model_name = "all-MiniLM-L6-v2"
+embedding_backend_name = None  # None uses the EMBEDDING_BACKEND env var (default "sentence-transformers")
+onnx_model_dir = "AI/onnx_all-MiniLM-L6-v2"
 
 version_string = "Chadbot Sigma v2"
 
@@ -34,7 +35,7 @@ class NDWDocBot:
             print("✓ Metadata loaded")
 
             # Load embedding model
-            self.embedding_model = SentenceTransformer(embedding_model_name)
+            self.embedding_model = load_embedding_backend(embedding_backend_name, onnx_model_dir)
             print("✓ Embedding model loaded")
 
         except Exception as e:
@@ -68,7 +69,7 @@ class NDWDocBot:
     def search_docs(self, query):
         """Find relevant NDW documents"""
         # Convert query to embedding
-        query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)
+        query_embedding = self.embedding_model.encode([query])
 
         # Search for similar documents (only get top 2)
         distances, indices = self.index.search(query_embedding, 10)
@@ -0,0 +1,101 @@
+import json
+import os
+import numpy as np
+
+embedding_model_name = "all-MiniLM-L6-v2"
+onnx_model_dir = "onnx_all-MiniLM-L6-v2"
+
+# Backend used when nothing is passed explicitly, override with the EMBEDDING_BACKEND env var
+default_backend = os.environ.get("EMBEDDING_BACKEND", "sentence-transformers")
+
+
+class SentenceTransformerBackend:
+    """Embeds text with the original PyTorch SentenceTransformer model"""
+
+    def __init__(self, model_name=embedding_model_name):
+        # Imported here so the ONNX backend never has to load PyTorch
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts, show_progress_bar=False):
+        return self.model.encode(texts, show_progress_bar=show_progress_bar, convert_to_numpy=True)
+
+
+class OnnxBackend:
+    """Embeds text with an exported ONNX Runtime model (see export_onnx_model.py)
+
+    Reproduces the SentenceTransformer pipeline (mean pooling + L2 normalization)
+    so the vectors can be searched against an index built with either backend.
+    """
+
+    def __init__(self, model_dir=onnx_model_dir, quantized=False, batch_size=32):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        with open(os.path.join(model_dir, "embedding_config.json"), "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+        self.dimension = config["dimension"]
+        self.batch_size = batch_size
+
+        # Padding and truncation are set here, the saved tokenizer does not keep the model's max_seq_length
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=config["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=config["pad_token_id"], pad_token=config["pad_token"])
+
+        model_file = "model_quantized.onnx" if quantized else "model.onnx"
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, model_file),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts, show_progress_bar=False):
+        batches = range(0, len(texts), self.batch_size)
+        if show_progress_bar:
+            from tqdm import tqdm
+            batches = tqdm(batches, desc="Batches")
+
+        embeddings = [self._encode_batch(texts[start:start + self.batch_size]) for start in batches]
+        if not embeddings:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return np.concatenate(embeddings)
+
+    def _encode_batch(self, texts):
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        token_type_ids = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        inputs = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": token_type_ids
+        }
+        token_embeddings = self.session.run(None, {k: v for k, v in inputs.items() if k in self.input_names})[0]
+
+        # Mean pooling over the non-padding tokens
+        mask = attention_mask[:, :, None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        # L2 normalization, same as the Normalize module of all-MiniLM-L6-v2
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+def load_embedding_backend(name=None, model_dir=onnx_model_dir):
+    """Create an embedding backend: 'sentence-transformers', 'onnx' or 'onnx-int8'"""
+    name = name or default_backend
+    if name == "sentence-transformers":
+        return SentenceTransformerBackend()
+    if name == "onnx":
+        return OnnxBackend(model_dir)
+    if name == "onnx-int8":
+        return OnnxBackend(model_dir, quantized=True)
+    raise ValueError(f"Unknown embedding backend: {name}")
@@ -0,0 +1,67 @@
+import json
+import os
+import torch
+from sentence_transformers import SentenceTransformer
+from onnxruntime.quantization import quantize_dynamic, QuantType
+from embedding_backend import embedding_model_name, onnx_model_dir
+
+
+class TransformerOutput(torch.nn.Module):
+    """Calls the transformer with keyword inputs, its forward() argument order differs between versions"""
+
+    def __init__(self, transformer):
+        super().__init__()
+        self.transformer = transformer
+
+    def forward(self, input_ids, attention_mask, token_type_ids):
+        return self.transformer(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            token_type_ids=token_type_ids
+        ).last_hidden_state
+
+
+# 1. Load the SentenceTransformer model and its transformer/tokenizer
+model = SentenceTransformer(embedding_model_name, device="cpu")
+transformer = model[0].auto_model
+tokenizer = model.tokenizer
+transformer.eval()
+
+os.makedirs(onnx_model_dir, exist_ok=True)
+model_file = os.path.join(onnx_model_dir, "model.onnx")
+quantized_model_file = os.path.join(onnx_model_dir, "model_quantized.onnx")
+
+# 2. Export the transformer (without pooling/normalization, done in numpy by OnnxBackend)
+dummy = tokenizer(["Nationaal Dataportaal Wegverkeer"], return_tensors="pt")
+input_names = ["input_ids", "attention_mask", "token_type_ids"]
+dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+with torch.no_grad():
+    torch.onnx.export(
+        TransformerOutput(transformer),
+        (dummy["input_ids"], dummy["attention_mask"], dummy["token_type_ids"]),
+        model_file,
+        input_names=input_names,
+        output_names=["last_hidden_state"],
+        dynamic_axes=dynamic_axes,
+        opset_version=14,
+        dynamo=False
+    )
+
+# 3. Create an int8 quantized copy (dynamic quantization of the weights)
+quantize_dynamic(model_file, quantized_model_file, weight_type=QuantType.QInt8)
+
+# 4. Save the tokenizer and the settings OnnxBackend needs
+tokenizer.backend_tokenizer.save(os.path.join(onnx_model_dir, "tokenizer.json"))
+config = {
+    "model_name": embedding_model_name,
+    "dimension": model.get_sentence_embedding_dimension(),
+    "max_seq_length": model.max_seq_length,
+    "pad_token": tokenizer.pad_token,
+    "pad_token_id": tokenizer.pad_token_id
+}
+with open(os.path.join(onnx_model_dir, "embedding_config.json"), "w", encoding="utf-8") as f:
+    json.dump(config, f, indent=2)
+
+print(f"ONNX models ({model_file}, {quantized_model_file}) exported successfully!")